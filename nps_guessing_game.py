@@ -1,11 +1,28 @@
 import streamlit as st
 import streamlit.components.v1 as components
+from streamlit.runtime.scriptrunner import add_script_run_ctx
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import random
 import time
-from typing import List, Dict, Optional
+import functools
+import threading
+from typing import List, Dict, Optional, FrozenSet, NamedTuple, Tuple
+from dataclasses import dataclass
 import os
+import sys
 import urllib.parse
+from io import BytesIO
+import tempfile
+import hashlib
+from datetime import date
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import numpy as np
+import pandas as pd
+import orjson
+from PIL import Image
 
 st.set_page_config(
     page_title="NPS Park Guessing Game",
@@ -14,233 +31,239 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+@st.cache_data
+def _get_css() -> str:
+    """
+    Read the mobile stylesheet from assets/ once, reruns reuse the cached text.
+    """
+    return (Path(__file__).parent / "assets" / "mobile.css").read_text()
+
 # Add custom CSS for mobile responsiveness
-st.markdown("""
-<style>
-    /* Mobile-first responsive design */
-    @media (max-width: 768px) {
-        /* Main container adjustments */
-        .main .block-container {
-            padding-top: 1rem;
-            padding-bottom: 1rem;
-            padding-left: 1rem;
-            padding-right: 1rem;
-        }
-        
-        /* Title styling for mobile */
-        h1 {
-            font-size: 1.8rem !important;
-            text-align: center;
-            margin-bottom: 0.5rem;
-        }
-        
-        /* Description text */
-        .description {
-            text-align: center;
-            font-size: 0.9rem;
-            margin-bottom: 1rem;
-        }
-        
-        /* Image container for mobile */
-        .stImage > div {
-            text-align: center;
-        }
-        
-        .stImage img {
-            max-width: 100% !important;
-            height: auto !important;
-            border-radius: 10px;
-            box-shadow: 0 4px 8px rgba(0,0,0,0.1);
-        }
-        
-        /* Ensure custom metrics layout stays on one line */
-        div[style*="flex-wrap: nowrap"] {
-            flex-wrap: nowrap !important;
-        }
-        
-        /* Button styling for mobile */
-        .stButton > button {
-            width: 100% !important;
-            margin: 0.25rem 0;
-            padding: 0.75rem;
-            font-size: 1rem;
-            border-radius: 8px;
-            border: none;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }
-        
-        .stButton > button:hover {
-            transform: translateY(-1px);
-            box-shadow: 0 4px 8px rgba(0,0,0,0.15);
-        }
-        
-        /* Text input styling */
-        .stTextInput > div > div > input {
-            font-size: 1rem;
-            padding: 0.75rem;
-            border-radius: 8px;
-            border: 2px solid #e0e0e0;
-        }
-        
-        .stTextInput > div > div > input:focus {
-            border-color: #4CAF50;
-            box-shadow: 0 0 0 2px rgba(76, 175, 80, 0.2);
-        }
-        
-        /* Guess history styling */
-        .guess-item {
-            background: #f8f9fa;
-            border-radius: 8px;
-            padding: 0.75rem;
-            margin: 0.5rem 0;
-            border-left: 4px solid #4CAF50;
-        }
-        
-        .guess-item.correct {
-            border-left-color: #4CAF50;
-            background: #e8f5e8;
-        }
-        
-        .guess-item.incorrect {
-            border-left-color: #ff9800;
-            background: #fff3e0;
-        }
-        
-        /* Mobile-specific: dark text for better contrast on light backgrounds */
-        @media (max-width: 768px) {
-            .guess-item {
-                color: #1f1f1f !important;
-            }
-            
-            .guess-item strong {
-                color: #1f1f1f !important;
-            }
-            
-            .guess-item span {
-                color: #1f1f1f !important;
-            }
-        }
-        
-        /* Sidebar adjustments for mobile */
-        .css-1d391kg {
-            padding-top: 1rem;
-        }
-        
-        /* Park info section */
-        .park-info {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 1rem;
-            border-radius: 10px;
-            margin: 1rem 0;
-        }
-        
-        .park-info h3 {
-            color: white;
-            margin-bottom: 0.5rem;
-        }
-        
-        /* Success/error messages */
-        .stSuccess, .stError, .stWarning {
-            border-radius: 8px;
-            padding: 1rem;
-            margin: 0.5rem 0;
-        }
-        
-        /* Loading spinner */
-        .stSpinner {
-            text-align: center;
-        }
-    }
+st.markdown(f"<style>\n{_get_css()}</style>", unsafe_allow_html=True)
+
+NPS_API_BASE = "https://developer.nps.gov/api/v1"
+DEFAULT_API_KEY = "DEMO_KEY"  
+NPS_PAGE_SIZE = 100
+NPS_MAX_WORKERS = 8
+
+BUG_REPORT_URL = "https://github.com/rthurmes/np-worlde/issues/new"
+
+# the issue body template is fixed apart from the description at the top, so it only gets encoded once
+_BUG_REPORT_BODY_HEAD = urllib.parse.quote_plus("**Bug Description:**\n")
+_BUG_REPORT_BODY_TAIL = urllib.parse.quote_plus("""
+
+**Steps to Reproduce:**
+1. 
+2. 
+3. 
+
+**Expected Behavior:**
+
+
+**Actual Behavior:**
+
+
+**Browser/Device Info:**
+- Browser: 
+- Device: 
+- Operating System: 
+
+**Additional Context:**
+Add any other context about the problem here.
+
+---
+*This issue was created via the in-app bug report feature.*
+""")
+
+# One shared session for NPS API requests, so connections (and their TCP/TLS handshakes)
+# are reused across calls and sessions. The API key is sent per request, since different
+# players can be using different keys at the same time.
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=NPS_MAX_WORKERS,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+))
+
+# Park photos get their own pooled session with no retries and a short (connect, read) timeout.
+# The image download blocks the script run, and on failure main just hands the URL to the
+# browser, so waiting out retries on a slow image host would only stall the page
+IMAGE_SESSION = requests.Session()
+IMAGE_SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=0))
+IMAGE_TIMEOUT = (3, 5)
+
+# park photos are shrunk to this bounding box and re-encoded before being sent to the browser.
+# JPEG because st.image passes JPEG/PNG/GIF bytes through as is but re-encodes anything else
+# (WebP included) as JPEG on every call, and the box stays under Streamlit's 1460px content
+# width so it never resizes them either
+IMAGE_MAX_SIZE = (1200, 1200)
+IMAGE_JPEG_QUALITY = 80
+
+# common generic park words to exclude from matching. come back to this later. probably a better way
+GENERIC_WORDS = frozenset({
+    'national', 'park', 'monument', 'memorial', 'historic', 'historical', 
+    'site', 'area', 'preserve', 'reserve', 'recreation', 'seashore', 
+    'lakeshore', 'river', 'trail', 'scenic', 'byway', 'corridor',
+    'battlefield', 'cemetery', 'cemeteries', 'military', 'state'
+})
+
+# An exact word hit scores 100 minus 5 per meaningful name word, while a park that only contains
+# the word as a substring scores at most 49 - 5. So for one word guesses an exact hit always
+# outranks substring hits, as long as the name has fewer meaningful words than this.
+EXACT_HIT_MAX_NAME_WORDS = 12
+
+# clockwise from north, one per 45 degree slice of the compass
+ARROWS = ("⬆️", "↗️", "➡️", "↘️", "⬇️", "↙️", "⬅️", "↖️")
+
+# one row per guess in game_state['guesses']
+GUESS_DTYPE = np.dtype([
+    ('park_id', 'i4'),
+    ('distance', 'f4'),  # miles
+    ('dir_idx', 'i1'),  # index into ARROWS
+    ('correct', '?')
+])
+
+# park data barely changes, so keep a copy on disk that survives process restarts
+PARKS_CACHE_DIR = Path(tempfile.gettempdir())
+PARKS_CACHE_MAX_AGE = 24 * 60 * 60  # seconds
+
+class Park(NamedTuple):
+    """A single park, copied out of a ParksTable."""
+    id: int
+    name: str
+    park_code: str
+    description: str
+    designation: str
+    image_url: str
+    city: str
+    state: str
+    lat: float
+    lon: float
+
+@dataclass(eq=False)
+class ParksTable:
+    """
+    All parks stored column-wise: one array or list per field, indexed by park id.
+    Built once by build_parks_table and shared by every session, so treat it as read only.
+    """
+    name: List[str]
+    name_lower: List[str]
+    park_code: List[str]
+    description: List[str]
+    designation: np.ndarray  # str, so the designation filter can run in numpy
+    designations: List[str]  # sorted choices for the sidebar filter, see get_unique_designations
+    designation_to_ids: Dict[str, np.ndarray]  # designation -> sorted int32 park ids
+    image_url: List[str]
+    city: List[str]
+    state: List[str]
+    lat: np.ndarray  # float32 degrees
+    lon: np.ndarray  # float32 degrees
+    lat_rad: np.ndarray  # float64 radians, for the distance/bearing kernels
+    lon_rad: np.ndarray
+    # pairwise [from_id, to_id] lookups, so answering a guess needs no trigonometry
+    distance_matrix: np.ndarray  # float32 miles
+    arrow_matrix: np.ndarray  # int8 indices into ARROWS
+    # matcher lookups (see find_park_by_guess)
+    name_index: Dict[str, int]  # full lowercase name -> park id, first park wins on duplicates
+    word_index: Dict[str, np.ndarray]  # meaningful name word -> sorted int32 park ids
+    unique_word_to_park: Dict[str, int]  # words used by exactly one park name
+    trigram_index: Dict[str, np.ndarray]  # 3 letter slice of a name word -> sorted int32 park ids
+    name_tokens: List[Tuple[str, ...]]  # lowercase meaningful name words, in name order
+    name_word_sets: List[FrozenSet[str]]
+    name_keys: List[str]  # meaningful name words joined by spaces
+    # changes whenever park ids would point at different parks, so game state can tell it is stale
+    fingerprint: str
     
-    /* Desktop improvements */
-    @media (min-width: 769px) {
-        .stImage img {
-            border-radius: 10px;
-            box-shadow: 0 4px 12px rgba(0,0,0,0.15);
-        }
-        
-        .stButton > button {
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }
-        
-        .stButton > button:hover {
-            transform: translateY(-1px);
-            box-shadow: 0 4px 8px rgba(0,0,0,0.15);
-        }
-    }
+    def __len__(self) -> int:
+        return len(self.name)
     
-    /* General improvements */
-    .main-header {
-        text-align: center;
-        margin-bottom: 2rem;
+    def get_row(self, park_id: int) -> Park:
+        """Copy one park out of the table."""
+        return Park(
+            id=park_id,
+            name=self.name[park_id],
+            park_code=self.park_code[park_id],
+            description=self.description[park_id],
+            designation=str(self.designation[park_id]),
+            image_url=self.image_url[park_id],
+            city=self.city[park_id],
+            state=self.state[park_id],
+            lat=float(self.lat[park_id]),
+            lon=float(self.lon[park_id]),
+        )
+
+def _fetch_parks_page(api_key: str, start: int) -> Tuple[int, List[Dict]]:
+    """
+    Fetch one page of the NPS /parks endpoint, starting at the given offset,
+    and trim it down to the fields the game uses right away so the raw page can be freed.
+    Returns the total number of parks the API reports and the parks on this page.
+    """
+    headers = {
+        'X-Api-Key': api_key,
+        'Accept': 'application/json'
     }
     
-    .game-container {
-        background: #f8f9fa;
-        border-radius: 15px;
-        padding: 1.5rem;
-        margin: 1rem 0;
-        box-shadow: 0 4px 6px rgba(0,0,0,0.1);
+    params = {
+        'fields': 'images,addresses',
+        'start': start,
+        'limit': NPS_PAGE_SIZE
     }
-</style>
-""", unsafe_allow_html=True)
-
-NPS_API_BASE = "https://developer.nps.gov/api/v1"
-DEFAULT_API_KEY = "DEMO_KEY"  
+    
+    response = SESSION.get(f"{NPS_API_BASE}/parks", headers=headers, params=params, timeout=30)
+    response.raise_for_status()
+    data = orjson.loads(response.content)
+    
+    parks_with_images = []
+    
+    for park in data.get('data', []):
+        # Only include parks that have images and location data
+        if (park.get('images') and 
+            park.get('addresses') and 
+            len(park['images']) > 0 and 
+            len(park['addresses']) > 0):
+            
+            # Get the first image
+            image = park['images'][0]
+            address = park['addresses'][0]
+            
+            park_data = {
+                'name': park.get('fullName', 'Unknown Park'),
+                'park_code': park.get('parkCode', ''),
+                'description': park.get('description', ''),
+                'designation': park.get('designation', 'Unknown'),  # Add park designation/type
+                'image_url': image.get('url', ''),
+                'image_alt': image.get('altText', ''),
+                'image_caption': image.get('caption', ''),
+                'city': address.get('city', ''),
+                'state': address.get('stateCode', ''),
+                'state_name': address.get('stateName', ''),
+                'coordinates': {
+                    'lat': float(park.get('latitude', 0)) if park.get('latitude') else 0,
+                    'lon': float(park.get('longitude', 0)) if park.get('longitude') else 0
+                }
+            }
+            
+            # Only add if we have essential data
+            if park_data['image_url'] and park_data['state']:
+                parks_with_images.append(park_data)
+    
+    return int(data.get('total', 0)), parks_with_images
 
-@st.cache_data(ttl=3600)  
-def fetch_parks_data(api_key: str) -> List[Dict]:
+def _fetch_from_api(api_key: str) -> List[Dict]:
     """
     Fetch park data from NPS API with images and location information.
     Returns a list of parks with their images and location data.
     """
     try:
-        headers = {'X-Api-Key': api_key}
-        
-        params = {
-            'fields': 'images,addresses',
-            'limit': 700  
-        }
-        
-        response = requests.get(f"{NPS_API_BASE}/parks", headers=headers, params=params)
-        response.raise_for_status()
-        
-        data = response.json()
-        parks_with_images = []
-        
-        for park in data.get('data', []):
-            # Only include parks that have images and location data
-            if (park.get('images') and 
-                park.get('addresses') and 
-                len(park['images']) > 0 and 
-                len(park['addresses']) > 0):
-                
-                # Get the first image
-                image = park['images'][0]
-                address = park['addresses'][0]
-                
-                park_data = {
-                    'name': park.get('fullName', 'Unknown Park'),
-                    'park_code': park.get('parkCode', ''),
-                    'description': park.get('description', ''),
-                    'designation': park.get('designation', 'Unknown'),  # Add park designation/type
-                    'image_url': image.get('url', ''),
-                    'image_alt': image.get('altText', ''),
-                    'image_caption': image.get('caption', ''),
-                    'city': address.get('city', ''),
-                    'state': address.get('stateCode', ''),
-                    'state_name': address.get('stateName', ''),
-                    'coordinates': {
-                        'lat': float(park.get('latitude', 0)) if park.get('latitude') else 0,
-                        'lon': float(park.get('longitude', 0)) if park.get('longitude') else 0
-                    }
-                }
-                
-                # Only add if we have essential data
-                if park_data['image_url'] and park_data['state']:
-                    parks_with_images.append(park_data)
+        # the first page tells us how many parks there are, then fetch the rest in parallel
+        total, parks_with_images = _fetch_parks_page(api_key, 0)
+        with ThreadPoolExecutor(max_workers=NPS_MAX_WORKERS) as executor:
+            pages = executor.map(
+                lambda start: _fetch_parks_page(api_key, start),
+                range(NPS_PAGE_SIZE, total, NPS_PAGE_SIZE)
+            )
+            for _, page_parks in pages:
+                parks_with_images.extend(page_parks)
         
         return parks_with_images
         
@@ -251,165 +274,390 @@ def fetch_parks_data(api_key: str) -> List[Dict]:
         st.error(f"Unexpected error: {e}")
         return []
 
-def calculate_distance_miles(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+def _parks_cache_key(api_key: str) -> str:
+    """Short, filename safe stand-in for the API key, so the key itself never touches disk."""
+    return hashlib.md5(api_key.encode()).hexdigest()[:8]
+
+def _parks_cache_path(api_key: str) -> Path:
+    """Today's on-disk cache file for this API key. A new day means a new file, so a fresh fetch."""
+    return PARKS_CACHE_DIR / f"nps_parks_{_parks_cache_key(api_key)}_{date.today().isoformat()}.parquet"
+
+def _read_parks_cache(api_key: str) -> Optional[List[Dict]]:
+    """
+    Read parks from the on-disk cache if it exists and is fresh enough.
+    Returns None when the cache is missing, stale or unreadable.
+    """
+    cache_path = _parks_cache_path(api_key)
+    try:
+        if time.time() - cache_path.stat().st_mtime > PARKS_CACHE_MAX_AGE:
+            return None
+        parks = pd.read_parquet(cache_path).to_dict('records')
+    except (OSError, ValueError):
+        return None
+    
+    # coordinates are flattened into lat/lon columns on disk
+    for park in parks:
+        park['coordinates'] = {'lat': park.pop('lat'), 'lon': park.pop('lon')}
+    return parks
+
+def _write_parks_cache(api_key: str, parks: List[Dict]):
+    """
+    Write parks to today's on-disk cache for this API key, and drop older days' files.
+    Failing to write is not fatal.
+    """
+    rows = []
+    for park in parks:
+        row = {key: value for key, value in park.items() if key != 'coordinates'}
+        row['lat'] = park['coordinates']['lat']
+        row['lon'] = park['coordinates']['lon']
+        rows.append(row)
+    
+    cache_path = _parks_cache_path(api_key)
+    try:
+        pd.DataFrame(rows).to_parquet(cache_path, index=False)
+        for old_path in PARKS_CACHE_DIR.glob(f"nps_parks_{_parks_cache_key(api_key)}_*.parquet"):
+            if old_path != cache_path:
+                old_path.unlink()
+    except (OSError, ValueError):
+        pass
+
+def build_parks_table(parks: List[Dict]) -> ParksTable:
     """
-    distance between two coordinates in miles
+    Convert the list of park dicts into a ParksTable,
+    precomputing the radian coordinates and the name word index along the way.
     """
-    import math
+    name_lower = [park['name'].lower() for park in parks]
+    lat = np.array([park['coordinates']['lat'] for park in parks], dtype=np.float32)
+    lon = np.array([park['coordinates']['lon'] for park in parks], dtype=np.float32)
+    lat_rad = np.radians(lat.astype(np.float64))
+    lon_rad = np.radians(lon.astype(np.float64))
+    
+    # every park against every other park, rows are the guess and columns the target
+    lat1, lon1 = lat_rad[:, None], lon_rad[:, None]
+    lat2, lon2 = lat_rad[None, :], lon_rad[None, :]
+    distance_matrix, bearing_matrix = distance_and_bearing_vector(lat1, lon1, lat2, lon2)
+    distance_matrix = distance_matrix.astype(np.float32)
+    arrow_matrix = bearings_to_arrow_indices(bearing_matrix)
+    
+    designation = np.array([park['designation'] for park in parks], dtype=str)
+    unique_designations, designation_codes = np.unique(designation, return_inverse=True)
+    designation_to_ids = {
+        value: np.flatnonzero(designation_codes == code).astype(np.int32)
+        for code, value in enumerate(unique_designations.tolist())
+    }
+    
+    word_to_ids = {}
+    name_tokens = []
+    for park_id, park_name in enumerate(name_lower):
+        # interned so parks sharing a word ("grand", "lake", "fort") share one string object.
+        # compile_guess interns guess words too, so the matcher's set and dict lookups on an
+        # exact word hit find the very same object and skip the string comparison
+        meaningful_park_words = tuple(sys.intern(word) for word in park_name.split() if word not in GENERIC_WORDS)
+        name_tokens.append(meaningful_park_words)
+        for word in meaningful_park_words:
+            ids = word_to_ids.setdefault(word, [])
+            if not ids or ids[-1] != park_id:
+                ids.append(park_id)
     
-    lat1, lon1, lat2, lon2 = map(math.radians, [lat1, lon1, lat2, lon2])
+    trigram_to_ids = {}
+    for park_id, tokens in enumerate(name_tokens):
+        for trigram in {word[i:i + 3] for word in tokens for i in range(len(word) - 2)}:
+            trigram_to_ids.setdefault(trigram, []).append(park_id)
     
-    dlat = lat2 - lat1
-    dlon = lon2 - lon1
-    a = math.sin(dlat/2)**2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon/2)**2
-    c = 2 * math.asin(math.sqrt(a))
+    return ParksTable(
+        name=[park['name'] for park in parks],
+        name_lower=name_lower,
+        park_code=[park['park_code'] for park in parks],
+        description=[park['description'] for park in parks],
+        designation=designation,
+        designations=[value for value in unique_designations.tolist() if value and value != 'Unknown'],
+        designation_to_ids=designation_to_ids,
+        image_url=[park['image_url'] for park in parks],
+        city=[park['city'] for park in parks],
+        state=[park['state'] for park in parks],
+        lat=lat,
+        lon=lon,
+        lat_rad=lat_rad,
+        lon_rad=lon_rad,
+        distance_matrix=distance_matrix,
+        arrow_matrix=arrow_matrix,
+        # reversed so the lowest id wins when two parks share a name, like the tie-break in find_park_by_guess
+        name_index={park_name.strip(): park_id for park_id, park_name in reversed(list(enumerate(name_lower)))},
+        word_index={word: np.array(ids, dtype=np.int32) for word, ids in word_to_ids.items()},
+        # a one word guess that uniquely names a park always wins (see EXACT_HIT_MAX_NAME_WORDS)
+        unique_word_to_park={
+            word: ids[0] for word, ids in word_to_ids.items()
+            if len(ids) == 1 and len(name_tokens[ids[0]]) < EXACT_HIT_MAX_NAME_WORDS
+        },
+        trigram_index={trigram: np.array(ids, dtype=np.int32) for trigram, ids in trigram_to_ids.items()},
+        name_tokens=name_tokens,
+        name_word_sets=[frozenset(words) for words in name_tokens],
+        name_keys=[' '.join(words) for words in name_tokens],
+        fingerprint=hashlib.md5('\n'.join(
+            f"{park['park_code']}\t{park['name']}" for park in parks
+        ).encode()).hexdigest(),
+    )
+
+@st.cache_resource(ttl=3600)
+def load_parks(api_key: str) -> ParksTable:
+    """
+    Load park data, from the on-disk cache when it is fresh and from the NPS API otherwise.
+    The returned table is shared by every session, so callers must not modify it.
+    """
+    parks = _read_parks_cache(api_key)
+    if parks is None:
+        parks = _fetch_from_api(api_key)
+        if parks:
+            _write_parks_cache(api_key, parks)
+    
+    # results memoized against an older table shouldn't keep it alive
+    _find_park_by_guess_cached.cache_clear()
+    return build_parks_table(parks)
+
+def _shrink_image(data: bytes) -> bytes:
+    """
+    Downscale an image to fit IMAGE_MAX_SIZE and re-encode it as an optimized JPEG.
+    NPS photos are often multi-megabyte JPEGs, far bigger than they are ever displayed.
+    Returns the original bytes if Pillow can't read or re-encode them.
+    """
+    try:
+        image = Image.open(BytesIO(data)).convert('RGB')
+        image.thumbnail(IMAGE_MAX_SIZE)
+        buffer = BytesIO()
+        image.save(buffer, format='JPEG', quality=IMAGE_JPEG_QUALITY, optimize=True)
+    except Exception:
+        # besides OSError/ValueError for unreadable data, Pillow raises DecompressionBombError
+        # (a plain Exception) for huge images and KeyError when the build lacks an encoder.
+        # Shrinking is only an optimization, so any failure falls back to the original bytes
+        return data
+    return buffer.getvalue()
+
+# no spinner: prefetch_image calls this from a background thread, where a spinner would be
+# drawn into whatever script run happens to be active
+@st.cache_resource(max_entries=128, show_spinner=False)
+def get_image_bytes(url: str) -> bytes:
+    """
+    Download a park image once, shrink it, and keep the result in memory,
+    so reruns and other sessions showing the same park skip the network.
+    Raises requests.exceptions.RequestException if the download fails (failures are not cached).
+    """
+    response = IMAGE_SESSION.get(url, timeout=IMAGE_TIMEOUT)
+    response.raise_for_status()
+    return _shrink_image(response.content)
+
+def prefetch_image(url: str):
+    """
+    Warm get_image_bytes for url in a background thread, overlapping the download
+    with the player's think time. Errors are ignored; the real call will retry.
+    """
+    def fetch():
+        try:
+            get_image_bytes(url)
+        except requests.exceptions.RequestException:
+            pass
+    
+    thread = threading.Thread(target=fetch, daemon=True)
+    add_script_run_ctx(thread)
+    thread.start()
+
+def bearings_to_arrow_indices(bearings: np.ndarray) -> np.ndarray:
+    """
+    Map compass bearings in degrees (0-360) to indices into ARROWS.
+    Each arrow covers a 45 degree slice centered on its direction.
+    """
+    return ((bearings + 22.5) // 45).astype(np.int8) % 8
+
+def distance_and_bearing_vector(lat1_rad, lon1_rad, lat2_rad, lon2_rad) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Haversine distance and initial bearing in one pass, so the trig the
+    two formulas share only gets computed once. Takes coordinates in radians
+    (scalars or arrays, broadcast against each other) and returns distances in miles
+    and bearings in degrees [0, 360).
+    """
+    sin_lat1, cos_lat1 = np.sin(lat1_rad), np.cos(lat1_rad)
+    sin_lat2, cos_lat2 = np.sin(lat2_rad), np.cos(lat2_rad)
+    dlon = lon2_rad - lon1_rad
+    sin_half_dlon = np.sin(dlon/2)
+    cos_half_dlon = np.cos(dlon/2)
+    
+    a = np.sin((lat2_rad - lat1_rad)/2)**2 + cos_lat1 * cos_lat2 * sin_half_dlon**2
+    # rounding can push a just past 1 for near antipodal pairs, which would turn into NaN
+    # below. Matters once every pair gets computed
+    c = 2 * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
     r = 3959
-    return c * r
-
-def get_direction_arrow(lat1: float, lon1: float, lat2: float, lon2: float) -> str:
-    """
-    Get direction arrow from guess to target park.
-    Returns an arrow emoji pointing in the general direction.
-    """
-    import math
-    
-    # bearing
-    dlon = math.radians(lon2 - lon1)
-    lat1_rad = math.radians(lat1)
-    lat2_rad = math.radians(lat2)
-    
-    y = math.sin(dlon) * math.cos(lat2_rad)
-    x = math.cos(lat1_rad) * math.sin(lat2_rad) - math.sin(lat1_rad) * math.cos(lat2_rad) * math.cos(dlon)
-    
-    bearing = math.degrees(math.atan2(y, x))
-    bearing = (bearing + 360) % 360
-    
-    
-    if 337.5 <= bearing or bearing < 22.5:
-        return "⬆️"  
-    elif 22.5 <= bearing < 67.5:
-        return "↗️"  
-    elif 67.5 <= bearing < 112.5:
-        return "➡️" 
-    elif 112.5 <= bearing < 157.5:
-        return "↘️"  
-    elif 157.5 <= bearing < 202.5:
-        return "⬇️" 
-    elif 202.5 <= bearing < 247.5:
-        return "↙️" 
-    elif 247.5 <= bearing < 292.5:
-        return "⬅️" 
-    elif 292.5 <= bearing < 337.5:
-        return "↖️"  
-    else:
-        return "⬆️"  
+    distance = c * r
+    
+    # double angle identities give the full dlon terms from the half angle ones above
+    sin_dlon = 2 * sin_half_dlon * cos_half_dlon
+    cos_dlon = 1 - 2 * sin_half_dlon**2
+    y = sin_dlon * cos_lat2
+    x = cos_lat1 * sin_lat2 - sin_lat1 * cos_lat2 * cos_dlon
+    bearing = (np.degrees(np.arctan2(y, x)) + 360) % 360
+    
+    return distance, bearing
+
+class CompiledGuess(NamedTuple):
+    """A guess parsed once into the pieces the matcher works with."""
+    text: str  # lowercased and stripped
+    words: Tuple[str, ...]  # meaningful words, generic park words removed
+
+def compile_guess(guess: str) -> CompiledGuess:
+    """
+    Parse a guess for find_park_by_guess and score_park.
+    Compiling once lets a caller score the same guess against many parks.
+    """
+    guess_lower = guess.lower().strip()
+    guess_words = guess_lower.split()
+    # interned to match the park name words, see build_parks_table
+    meaningful_guess_words = tuple(sys.intern(word) for word in guess_words if word not in GENERIC_WORDS)
+    return CompiledGuess(guess_lower, meaningful_guess_words)
 
-def find_park_by_guess(guess: str, parks: List[Dict]) -> Optional[Dict]:
+def score_park(compiled: CompiledGuess, parks: ParksTable, park_id: int) -> Optional[Tuple[int, int]]:
     """
-    Find a park that matches the user's guess.
+    Score one park against a compiled guess.
+    Every guess word has to match a park name word, either exactly (100 points)
+    or as a substring of at least 3 letters (up to 50 points, by how much of the word it covers).
+    Longer names pay a small penalty, so "glacier" prefers Glacier over Glacier Bay.
+    Returns (score, exact_matches), or None if some guess word doesn't match.
+    """
+    park_word_set = parks.name_word_sets[park_id]
+    park_key = parks.name_keys[park_id]
+    
+    exact_matches = 0
+    match_score = 0 
+    
+    for guess_word in compiled.words:
+        # First try exact word matches
+        if guess_word in park_word_set:
+            exact_matches += 1
+            match_score += 100
+            continue
+        
+        # Otherwise look for the guess inside a park word. Guess words have no spaces, so the
+        # first hit in the key string sits inside the first park word containing the guess;
+        # widen it out to the surrounding spaces.
+        pos = park_key.find(guess_word) if len(guess_word) >= 3 else -1
+        if pos == -1:
+            return None
+        word_start = park_key.rfind(' ', 0, pos) + 1
+        word_end = park_key.find(' ', pos)
+        if word_end == -1:
+            word_end = len(park_key)
+        match_ratio = len(guess_word) / (word_end - word_start)
+        match_score += int(50 * match_ratio)
+    
+    name_length_penalty = len(parks.name_tokens[park_id]) * 5
+    return match_score - name_length_penalty, exact_matches
+
+def find_park_by_guess(guess: str, parks: ParksTable, park_ids: np.ndarray) -> Optional[int]:
+    """
+    Find a park that matches the user's guess, among the parks in park_ids.
     Requires at least one full word match in the park name (excluding generic park words).
     Prioritizes exact matches over partial matches.
+    Returns the id of the matching park, or None.
     """
-    guess_lower = guess.lower().strip()
+    return _find_park_by_guess_cached(compile_guess(guess), parks, park_ids.astype(np.int32).tobytes())
+
+@functools.lru_cache(maxsize=4096)
+def _find_park_by_guess_cached(compiled: CompiledGuess, parks: ParksTable, park_ids_key: bytes) -> Optional[int]:
+    """
+    Memoized body of find_park_by_guess, so a repeated guess is a single dict lookup.
+    The table hashes by identity, and park_ids arrive as raw int32 bytes so they can be part of the key.
+    load_parks clears this cache whenever it builds a new table.
+    """
+    park_ids = np.frombuffer(park_ids_key, dtype=np.int32)
     
     # ignore short bois
-    if len(guess_lower) < 2:
+    if len(compiled.text) < 2:
         return None
     
-    # common generic park words to exclude from matching. come back to this later. probably a better way
-    generic_words = {
-        'national', 'park', 'monument', 'memorial', 'historic', 'historical', 
-        'site', 'area', 'preserve', 'reserve', 'recreation', 'seashore', 
-        'lakeshore', 'river', 'trail', 'scenic', 'byway', 'corridor',
-        'battlefield', 'cemetery', 'cemeteries', 'military', 'state'
-    }
+    if not compiled.words:
+        return None
     
-    guess_words = guess_lower.split()
-    meaningful_guess_words = [word for word in guess_words if word not in generic_words]
+    # the full name typed out, nothing else can score higher
+    park_id = parks.name_index.get(compiled.text)
+    if park_id is not None and park_id in park_ids:
+        return park_id
     
-    if not meaningful_guess_words:
-        return None
+    # shortcut for guesses like "yellowstone" that only one park name contains
+    if len(compiled.words) == 1:
+        park_id = parks.unique_word_to_park.get(compiled.words[0])
+        if park_id is not None and park_id in park_ids:
+            return park_id
     
-    matching_parks = []
-    # this part is ranking based on matching words, so "glacier national park" will get a higher score than "glacier bay national park"
-    for park in parks:
-        park_name = park['name'].lower()
-        
-        park_words = park_name.split()
-        meaningful_park_words = [word for word in park_words if word not in generic_words]
-        
-        if not meaningful_park_words:
-            continue
-        
-        matches_found = 0
-        exact_matches = 0
-        total_guess_words = len(meaningful_guess_words)
-        match_score = 0 
-        
-        for guess_word in meaningful_guess_words:
-            word_matched = False
-            
-            # First try exact word matches
-            for park_word in meaningful_park_words:
-                if guess_word == park_word:
-                    matches_found += 1
-                    exact_matches += 1
-                    match_score += 100
-                    word_matched = True
-                    break
+    candidates = None
+    
+    # a one word guess with exact hits only needs to rank those (see EXACT_HIT_MAX_NAME_WORDS),
+    # so "glacier" never has to look at parks that merely contain it
+    if len(compiled.words) == 1 and compiled.words[0] in parks.word_index:
+        exact_ids = np.intersect1d(park_ids, parks.word_index[compiled.words[0]], assume_unique=True)
+        if exact_ids.size and min(len(parks.name_tokens[i]) for i in exact_ids.tolist()) < EXACT_HIT_MAX_NAME_WORDS:
+            candidates = exact_ids
+    
+    # otherwise every guess word has to hit a park word, so narrow down to the parks in the posting
+    # lists of every guess word. Short words can only match exactly. Longer ones can also sit inside
+    # a park word, and that word then contains all of the guess word's trigrams.
+    if candidates is None:
+        candidates = park_ids
+        for guess_word in compiled.words:
+            if len(guess_word) >= 3:
+                postings = [parks.trigram_index.get(guess_word[i:i + 3]) for i in range(len(guess_word) - 2)]
+            else:
+                postings = [parks.word_index.get(guess_word)]
             
-            if not word_matched:
-                for park_word in meaningful_park_words:
-                    if len(park_word) >= 3 and guess_word in park_word and len(guess_word) >= 3:
-                        matches_found += 1
-                        match_ratio = len(guess_word) / len(park_word)
-                        match_score += int(50 * match_ratio)
-                        word_matched = True
-                        break
-        
-        if matches_found == total_guess_words and total_guess_words > 0:
-            name_length_penalty = len(meaningful_park_words) * 5
-            final_score = match_score - name_length_penalty
-            matching_parks.append((park, exact_matches, final_score))
+            for ids in postings:
+                if ids is None:
+                    return None
+                candidates = np.intersect1d(candidates, ids, assume_unique=True)
+                if candidates.size == 0:
+                    return None
     
-    if matching_parks:
-        matching_parks.sort(key=lambda x: (-x[2], -x[1], x[0]['name']))
-        return matching_parks[0][0]
+    # this part is ranking based on matching words, so "glacier national park" will get a higher score than "glacier bay national park".
+    # Only the best park is needed, so keep a running best instead of sorting every match;
+    # ties go to the exact matches and then the name, the first park wins a full tie
+    best_park_id = None
+    best_key = None
+    for park_id in candidates.tolist():
+        # trigrams can come from different park words, score_park weeds those parks out
+        result = score_park(compiled, parks, park_id)
+        if result is None:
+            continue
+        final_score, exact_matches = result
+        rank_key = (-final_score, -exact_matches, parks.name[park_id])
+        if best_key is None or rank_key < best_key:
+            best_park_id, best_key = park_id, rank_key
     
-    return None
+    return best_park_id
 
-def get_unique_designations(parks: List[Dict]) -> List[str]:
+def get_unique_designations(parks: ParksTable) -> List[str]:
     """
-    Extract unique park designations from the parks list.
+    Unique park designations from the parks table, worked out once in build_parks_table.
     Returns a sorted list of unique designations.
     """
-    designations = set()
-    for park in parks:
-        designation = park.get('designation', 'Unknown')
-        if designation and designation != 'Unknown':
-            designations.add(designation)
-    return sorted(list(designations))
+    return parks.designations
 
-def filter_parks_by_designation(parks: List[Dict], selected_designations: List[str]) -> List[Dict]:
+def filter_parks_by_designation(parks: ParksTable, selected_designations: List[str]) -> np.ndarray:
     """
     Filter parks based on selected designations.
-    If no designations are selected, returns all parks.
+    Returns the ids of the matching parks; if no designations are selected, returns all park ids.
     """
     if not selected_designations:
-        return parks
+        return np.arange(len(parks), dtype=np.int32)
     
-    filtered = []
-    for park in parks:
-        if park.get('designation') in selected_designations:
-            filtered.append(park)
-    return filtered
+    # gather the precomputed id lists, sorted back into park order like the unfiltered ids
+    id_lists = [parks.designation_to_ids[designation] for designation in selected_designations if designation in parks.designation_to_ids]
+    if not id_lists:
+        return np.empty(0, dtype=np.int32)
+    return np.sort(np.concatenate(id_lists))
 
 def initialize_game_state():
     """Initialize the game state in session state."""
     if 'game_state' not in st.session_state:
         st.session_state.game_state = {
-            'current_park': None,
-            'guesses': [],
+            'parks_fingerprint': None,  # ParksTable.fingerprint of the table the ids below came from
+            'current_park_id': None,
+            'next_park_id': None,  # picked ahead of time so its image can be prefetched
+            'guesses': np.empty(0, dtype=GUESS_DTYPE),
             'max_guesses': 6,
             'game_over': False,
             'score': 0,
@@ -420,54 +668,40 @@ def initialize_game_state():
 def reset_game():
     """Reset the current game while keeping overall stats."""
     st.session_state.game_state.update({
-        'current_park': None,
-        'guesses': [],
+        'current_park_id': st.session_state.game_state.get('next_park_id'),
+        'next_park_id': None,
+        'guesses': np.empty(0, dtype=GUESS_DTYPE),
         'game_over': False
     })
 
+def render_guess_row(i: int, guess_row: np.void, parks: ParksTable) -> str:
+    """Build the styled HTML block for one entry of the guess history."""
+    guess_class = "correct" if guess_row['correct'] else "incorrect"
+    status_icon = "🎯" if guess_row['correct'] else "❌"
+    
+    return f'''
+    <div class="guess-item {guess_class}">
+        <div style="display: flex; justify-content: space-between; align-items: center; flex-wrap: wrap;">
+            <div style="flex: 1; min-width: 200px;">
+                <strong>{status_icon} {i}. {parks.name[guess_row['park_id']]}</strong>
+            </div>
+            <div style="display: flex; gap: 1rem; align-items: center; flex-wrap: wrap;">
+                <span><strong>{guess_row['distance']:.0f} mi</strong></span>
+                <span style="font-size: 1.2em;">{ARROWS[guess_row['dir_idx']]}</span>
+            </div>
+        </div>
+    </div>
+    '''
+
 def create_bug_report_url(title: str, description: str, labels: str = "bug") -> str:
     """
     Create a pre-filled git issue URL
     """
-    github_repo = "rthurmes/np-worlde" 
-    
-    issue_body = f"""**Bug Description:**
-{description}
-
-**Steps to Reproduce:**
-1. 
-2. 
-3. 
-
-**Expected Behavior:**
-
-
-**Actual Behavior:**
-
-
-**Browser/Device Info:**
-- Browser: 
-- Device: 
-- Operating System: 
-
-**Additional Context:**
-Add any other context about the problem here.
-
----
-*This issue was created via the in-app bug report feature.*
-"""
-    
-    # URL encode the parameters
-    params = {
-        'title': title,
-        'body': issue_body,
-        'labels': labels
-    }
-    
-    # Create the GitHub issue URL
-    base_url = f"https://github.com/{github_repo}/issues/new"
-    query_string = urllib.parse.urlencode(params)
-    return f"{base_url}?{query_string}"
+    # same query string urlencode would build from title, body and labels
+    title_param = urllib.parse.quote_plus(title)
+    body_param = _BUG_REPORT_BODY_HEAD + urllib.parse.quote_plus(description) + _BUG_REPORT_BODY_TAIL
+    labels_param = urllib.parse.quote_plus(labels)
+    return f"{BUG_REPORT_URL}?title={title_param}&body={body_param}&labels={labels_param}"
 
 def show_bug_report_form():
     """Display the bug report form in the sidebar."""
@@ -565,15 +799,15 @@ def main():
     
     if api_key:
         with st.spinner("Loading National Parks data..."):
-            all_parks = fetch_parks_data(api_key)
+            parks = load_parks(api_key)
         
-        if not all_parks:
+        if not len(parks):
             st.error("No park data available. Please check your API key and try again.")
             return
         
         # Get unique designations and create filter
         st.sidebar.header("Park Type Filter")
-        unique_designations = get_unique_designations(all_parks)
+        unique_designations = get_unique_designations(parks)
         
         selected_designations = st.sidebar.multiselect(
             "Select park types to include:",
@@ -583,36 +817,61 @@ def main():
         )
         
         # Filter parks based on selected designations
-        parks = filter_parks_by_designation(all_parks, selected_designations)
+        park_ids = filter_parks_by_designation(parks, selected_designations)
         
-        if not parks:
+        if not park_ids.size:
             st.warning(f"No parks found matching the selected types: {', '.join(selected_designations)}. Please select different types or clear the selection.")
             return
         
         # Show count of filtered parks
-        st.sidebar.info(f"**{len(parks)}** parks available with selected types")
+        st.sidebar.info(f"**{len(park_ids)}** parks available with selected types")
         
         # Add bug report form to sidebar
         show_bug_report_form()
         
+        # The ids in the game state only mean something for the table they were picked from. load_parks
+        # rebuilds it hourly and refetches daily, and a park added or dropped shifts the ids, so start
+        # the game over instead of switching targets or showing the wrong names in the history
+        if st.session_state.game_state.get('parks_fingerprint') != parks.fingerprint:
+            st.session_state.game_state.update({
+                'parks_fingerprint': parks.fingerprint,
+                'current_park_id': None,
+                'next_park_id': None,
+                'guesses': np.empty(0, dtype=GUESS_DTYPE),
+                'game_over': False
+            })
+        
         # Select a random park if none is selected, or if park type filter changed
-        current_park = st.session_state.game_state.get('current_park')
+        current_park_id = st.session_state.game_state.get('current_park_id')
         
-        if not current_park:
-            st.session_state.game_state['current_park'] = random.choice(parks)
-        elif current_park not in parks:
+        if current_park_id is None:
+            st.session_state.game_state['current_park_id'] = int(random.choice(park_ids))
+        elif current_park_id not in park_ids:
             # Current park is not in filtered list, select a new one
-            st.session_state.game_state['current_park'] = random.choice(parks)
+            st.session_state.game_state['current_park_id'] = int(random.choice(park_ids))
             # Reset guesses since we're switching to a different park
-            st.session_state.game_state['guesses'] = []
+            st.session_state.game_state['guesses'] = np.empty(0, dtype=GUESS_DTYPE)
             st.session_state.game_state['game_over'] = False
         
-        current_park = st.session_state.game_state['current_park']
         game_state = st.session_state.game_state
+        current_park = parks.get_row(game_state['current_park_id'])
+        
+        # Pick the next game's park now and download its image while this game is played,
+        # so New Game doesn't wait on the network
+        next_park_id = game_state.get('next_park_id')
+        if next_park_id is None or next_park_id not in park_ids:
+            game_state['next_park_id'] = int(random.choice(park_ids))
+            prefetch_image(parks.image_url[game_state['next_park_id']])
         
         # Image section (no container wrapper for cleaner look)
+        try:
+            park_image = get_image_bytes(current_park.image_url)
+        except requests.exceptions.RequestException:
+            # let the browser try the URL itself
+            park_image = current_park.image_url
+        
         st.image(
-            current_park['image_url'], 
+            park_image, 
             caption=f"Guess this National Park!",
             width='stretch'  # Use stretch for responsive sizing
         )
@@ -643,98 +902,73 @@ def main():
         if not game_state['game_over']:
             st.subheader("Make Your Guess")
             
-            # Mobile-friendly input section
-            guess = st.text_input(
-                "Enter part of the park name:",
-                placeholder="e.g., Yellowstone, Grand Canyon, Acadia, Yosemite...",
-                key="guess_input",
-                help="Type any part of the park name to make your guess!"
-            )
-            
-            # Mobile-friendly button layout
-            col1, col2 = st.columns([2, 1])
+            # Typing into a form doesn't rerun the script, only submitting it does
+            with st.form("guess_form", clear_on_submit=True):
+                # Mobile-friendly input section
+                guess = st.text_input(
+                    "Enter part of the park name:",
+                    placeholder="e.g., Yellowstone, Grand Canyon, Acadia, Yosemite...",
+                    key="guess_input",
+                    help="Type any part of the park name to make your guess!"
+                )
+                
+                # Mobile-friendly button layout, both buttons submit the form so neither reruns per keystroke
+                col1, col2 = st.columns([2, 1])
+                with col1:
+                    submitted = st.form_submit_button("Submit Guess", width='stretch', type="primary")
+                with col2:
+                    gave_up = st.form_submit_button("Give Up", width='stretch')
             
-            with col1:
-                if st.button("Submit Guess", width='stretch', type="primary"):
-                    if guess:
-                        guessed_park = find_park_by_guess(guess, parks)
+            if submitted:
+                if guess:
+                    guessed_id = find_park_by_guess(guess, parks, park_ids)
+                    
+                    if guessed_id is not None:
+                        target_id = current_park.id
+                        is_correct = (guessed_id == target_id)
                         
-                        if guessed_park:
-                            distance = calculate_distance_miles(
-                                guessed_park['coordinates']['lat'],
-                                guessed_park['coordinates']['lon'],
-                                current_park['coordinates']['lat'],
-                                current_park['coordinates']['lon']
-                            )
-                            
-                            direction = get_direction_arrow(
-                                guessed_park['coordinates']['lat'],
-                                guessed_park['coordinates']['lon'],
-                                current_park['coordinates']['lat'],
-                                current_park['coordinates']['lon']
-                            )
-                            
-                            
-                            is_correct = (guessed_park['name'] == current_park['name'])
-                            
-                            game_state['guesses'].append({
-                                'guess': guess,
-                                'park_name': guessed_park['name'],
-                                'distance': distance,
-                                'direction': direction,
-                                'is_correct': is_correct
-                            })
-                            
-                            track_event('guess-submitted', {'attempt': len(game_state['guesses']), 'correct': is_correct})
-
-                            if is_correct:
-                                st.success(f"Correct! It's {current_park['name']}!")
-                                game_state['score'] += 1
-                                game_state['streak'] += 1
+                        guess_row = np.array([(
+                            guessed_id,
+                            parks.distance_matrix[guessed_id, target_id],
+                            parks.arrow_matrix[guessed_id, target_id],
+                            is_correct
+                        )], dtype=GUESS_DTYPE)
+                        game_state['guesses'] = np.append(game_state['guesses'], guess_row)
+                        
+                        track_event('guess-submitted', {'attempt': len(game_state['guesses']), 'correct': is_correct})
+
+                        if is_correct:
+                            st.success(f"Correct! It's {current_park.name}!")
+                            game_state['score'] += 1
+                            game_state['streak'] += 1
+                            game_state['game_over'] = True
+                            game_state['total_games'] += 1
+                            track_event('game-won', {'guesses': len(game_state['guesses'])})
+                        else:
+                            st.warning(f"Not quite! You guessed {parks.name[guessed_id]}")
+                            if len(game_state['guesses']) >= game_state['max_guesses']:
+                                st.error(f"Game Over! The correct answer was {current_park.name}")
+                                game_state['streak'] = 0
                                 game_state['game_over'] = True
                                 game_state['total_games'] += 1
-                                track_event('game-won', {'guesses': len(game_state['guesses'])})
-                            else:
-                                st.warning(f"Not quite! You guessed {guessed_park['name']}")
-                                if len(game_state['guesses']) >= game_state['max_guesses']:
-                                    st.error(f"Game Over! The correct answer was {current_park['name']}")
-                                    game_state['streak'] = 0
-                                    game_state['game_over'] = True
-                                    game_state['total_games'] += 1
-                        else:
-                            st.error("Park not found. Please try a different guess.")
                     else:
-                        st.warning("Please enter a guess!")
+                        st.error("Park not found. Please try a different guess.")
+                else:
+                    st.warning("Please enter a guess!")
             
-            with col2:
-                if st.button("Give Up", width='stretch'):
-                    st.error(f"The correct answer was {current_park['name']}!")
-                    game_state['streak'] = 0
-                    game_state['game_over'] = True
-                    game_state['total_games'] += 1
+            if gave_up:
+                st.error(f"The correct answer was {current_park.name}!")
+                game_state['streak'] = 0
+                game_state['game_over'] = True
+                game_state['total_games'] += 1
         
         # Display guess history with mobile-friendly styling
-        if game_state['guesses']:
+        if len(game_state['guesses']):
             st.subheader("Your Guesses")
             
-            for i, guess_data in enumerate(game_state['guesses'], 1):
-                # Create a styled guess item
-                guess_class = "correct" if guess_data['is_correct'] else "incorrect"
-                status_icon = "🎯" if guess_data['is_correct'] else "❌"
-                
-                st.markdown(f'''
-                <div class="guess-item {guess_class}">
-                    <div style="display: flex; justify-content: space-between; align-items: center; flex-wrap: wrap;">
-                        <div style="flex: 1; min-width: 200px;">
-                            <strong>{status_icon} {i}. {guess_data['park_name']}</strong>
-                        </div>
-                        <div style="display: flex; gap: 1rem; align-items: center; flex-wrap: wrap;">
-                            <span><strong>{guess_data['distance']:.0f} mi</strong></span>
-                            <span style="font-size: 1.2em;">{guess_data['direction']}</span>
-                        </div>
-                    </div>
-                </div>
-                ''', unsafe_allow_html=True)
+            # one markdown element for the whole history rather than one per guess
+            history_html = "".join(render_guess_row(i, guess_row, parks) for i, guess_row in enumerate(game_state['guesses'], 1))
+            st.markdown(history_html, unsafe_allow_html=True)
         
         if game_state['game_over']:
             st.subheader("🏞️ About This Park")
@@ -742,13 +976,13 @@ def main():
             # Mobile-friendly park info section
             st.markdown(f'''
             <div class="park-info">
-                <h3>{current_park['name']}</h3>
-                {f'<p><strong>Location:</strong> {current_park["city"]}, {current_park["state"]}</p>' if current_park['city'] and current_park['state'] else ''}
+                <h3>{current_park.name}</h3>
+                {f'<p><strong>Location:</strong> {current_park.city}, {current_park.state}</p>' if current_park.city and current_park.state else ''}
             </div>
             ''', unsafe_allow_html=True)
             
-            if current_park['description']:
-                st.markdown(f"**Description:**\n\n{current_park['description']}")
+            if current_park.description:
+                st.markdown(f"**Description:**\n\n{current_park.description}")
     
     else:
         st.warning("Please enter your NPS API key to start playing!")